@@ -1,9 +1,10 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
+import threading
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -11,6 +12,23 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Mr. Mark AI Engine", version="1.0.0")
 
+# 트렌드 시계열 저장소 (첫 조회 시 생성)
+# trend_series는 numpy/pandas가 필요하므로 앱 기동 시가 아니라 첫 조회 시 import
+_trend_store = None
+_trend_store_lock = threading.Lock()
+
+
+def get_trend_store():
+    global _trend_store
+    if _trend_store is None:
+        # 동시 요청이 저장소(DB engine)를 중복 생성하지 않도록 잠금
+        with _trend_store_lock:
+            if _trend_store is None:
+                from trend_series import create_store
+
+                _trend_store = create_store()
+    return _trend_store
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -76,6 +94,31 @@ def analyze_content():
         logger.error(f"콘텐츠 분석 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="콘텐츠 분석에 실패했습니다.")
 
+@app.get("/trends/series")
+def trend_series(
+    keyword: str,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    after: Optional[int] = None,
+    # trend_series.DEFAULT_POINTS / MAX_POINTS와 동일
+    points: int = Query(1000, ge=3, le=5000),
+    method: str = Query("lttb", pattern="^(lttb|minmax)$"),
+):
+    """트렌드 시계열 조회 API (서버 사이드 다운샘플링)
+
+    start/end(epoch ms) 구간을 최대 points개로 줄여 반환합니다.
+    after를 지정하면 그 이후 새로 들어온 포인트만 반환합니다(증분 업데이트).
+    """
+    store = get_trend_store()
+    store.sync()
+    if keyword not in store.keywords():
+        raise HTTPException(status_code=404, detail="존재하지 않는 키워드입니다.")
+    if after is not None:
+        x, y = store.since(keyword, after, points, method)
+    else:
+        x, y = store.query(keyword, start, end, points, method)
+    return {"keyword": keyword, "method": method, "x": x.tolist(), "y": y.tolist()}
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """전역 예외 처리"""
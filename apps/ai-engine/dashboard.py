@@ -1,28 +1,135 @@
 import dash
-from dash import html, dcc
-import plotly.express as px
+from dash import html, dcc, Input, Output, State
+import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
+
+from trend_series import DEFAULT_POINTS, create_store
+
+# 증분으로 이어 붙인 원본 포인트가 이 수를 넘으면 전체 구간을 다시 다운샘플링
+LIVE_REFRESH_POINTS = DEFAULT_POINTS
+LIVE_INTERVAL_MS = 5000
 
 app = dash.Dash(__name__)
+store = create_store()
+
+
+def _to_ms(value):
+    # Plotly relayoutData의 날짜 문자열 -> epoch ms
+    return pd.Timestamp(value).value // 1_000_000
+
+
+def render_figure(keyword, method, start=None, end=None):
+    """선택 구간을 서버에서 다운샘플링한 figure와 마지막 시각 반환"""
+    x, y = store.query(keyword, start, end, DEFAULT_POINTS, method)
+    fig = go.Figure(
+        go.Scattergl(x=x.tolist(), y=y.tolist(), mode="lines", name=keyword)
+    )
+    fig.update_layout(
+        title=f"실시간 트렌드: {keyword}",
+        xaxis={"type": "date"},
+        yaxis={"title": "검색량"},
+        uirevision=keyword,
+    )
+    return fig, int(x[-1]) if len(x) else None
+
+
+def live_points(keyword, method, after):
+    """after 이후 새 포인트만 extendData 형식으로 반환 (포인트 수 포함)"""
+    store.sync()
+    x, y = store.since(keyword, after, DEFAULT_POINTS, method)
+    if len(x) == 0:
+        return None, after, 0
+    # maxPoints로 자르면 앞쪽의 다운샘플링된 전체 구간이 사라지므로 지정하지 않음
+    return ({"x": [x.tolist()], "y": [y.tolist()]}, [0]), int(x[-1]), len(x)
 
-# 예시 데이터
-trend_data = pd.DataFrame(
-    {
-        "트렌드": ["인스타그램 릴스", "틱톡 마케팅", "AI 마케팅", "메타버스 광고"],
-        "검색량": np.random.randint(1000, 5000, 4),
-    }
-)
 
-fig = px.bar(trend_data, x="트렌드", y="검색량", title="실시간 트렌드")
+def serve_layout():
+    # 페이지를 열 때마다 생성: 빈 trends 테이블로 시작해도 이후 키워드가 반영됨
+    store.sync()
+    keywords = store.keywords()
+    return html.Div(
+        [
+            html.H1("Mr. Mark AI 대시보드"),
+            dcc.Dropdown(
+                id="keyword",
+                options=keywords,
+                value=keywords[0] if keywords else None,
+                clearable=False,
+            ),
+            dcc.RadioItems(
+                id="method",
+                options=[
+                    {"label": "LTTB", "value": "lttb"},
+                    {"label": "Min-Max", "value": "minmax"},
+                ],
+                value="lttb",
+                inline=True,
+            ),
+            dcc.Graph(id="trend-graph"),
+            dcc.Interval(id="live-interval", interval=LIVE_INTERVAL_MS),
+            # live: 전체 범위(autorange) 보기일 때만 새 포인트를 이어 붙임
+            # appended: 마지막 전체 렌더링 이후 이어 붙인 포인트 수
+            dcc.Store(
+                id="view-state", data={"last_ts": None, "live": True, "appended": 0}
+            ),
+            html.Div("품질지표, AI 예측, 실시간 데이터 등 다양한 시각화 추가 가능"),
+        ]
+    )
 
-app.layout = html.Div(
-    [
-        html.H1("Mr. Mark AI 대시보드"),
-        dcc.Graph(figure=fig),
-        html.Div("품질지표, AI 예측, 실시간 데이터 등 다양한 시각화 추가 가능"),
-    ]
+
+app.layout = serve_layout
+
+
+@app.callback(
+    Output("trend-graph", "figure"),
+    Output("trend-graph", "extendData"),
+    Output("view-state", "data"),
+    Input("keyword", "value"),
+    Input("method", "value"),
+    Input("trend-graph", "relayoutData"),
+    Input("live-interval", "n_intervals"),
+    State("view-state", "data"),
 )
+def update_graph(keyword, method, relayout, n_intervals, view_state):
+    return graph_update(dash.ctx.triggered_id, keyword, method, relayout, view_state)
+
+
+def graph_update(trigger, keyword, method, relayout, view_state):
+    """update_graph 본체 (trigger: 콜백을 발생시킨 컴포넌트 id)"""
+    if trigger == "live-interval":
+        if not view_state["live"] or view_state["last_ts"] is None:
+            raise dash.exceptions.PreventUpdate
+        extend, last_ts, n_new = live_points(keyword, method, view_state["last_ts"])
+        if extend is None:
+            raise dash.exceptions.PreventUpdate
+        appended = view_state.get("appended", 0) + n_new
+        if appended > LIVE_REFRESH_POINTS:
+            # 이어 붙인 원본 포인트가 쌓이면 전체 구간을 다시 다운샘플링
+            fig, last_ts = render_figure(keyword, method)
+            state = {"last_ts": last_ts, "live": True, "appended": 0}
+            return fig, dash.no_update, state
+        state = {**view_state, "last_ts": last_ts, "appended": appended}
+        return dash.no_update, extend, state
+
+    if keyword is None:
+        # 아직 트렌드 데이터가 없음 (빈 trends 테이블)
+        fig = go.Figure()
+        fig.update_layout(title="트렌드 데이터가 없습니다.")
+        return fig, dash.no_update, {"last_ts": None, "live": True, "appended": 0}
+
+    start = end = None
+    if trigger == "trend-graph":
+        relayout = relayout or {}
+        if "xaxis.range[0]" in relayout:
+            start = _to_ms(relayout["xaxis.range[0]"])
+            end = _to_ms(relayout["xaxis.range[1]"])
+        elif "xaxis.autorange" not in relayout:
+            # 줌/리셋 외의 relayout(autosize 등)은 무시
+            raise dash.exceptions.PreventUpdate
+    fig, last_ts = render_figure(keyword, method, start, end)
+    live = start is None
+    return fig, dash.no_update, {"last_ts": last_ts, "live": live, "appended": 0}
+
 
 if __name__ == "__main__":
-    app.run_server(debug=True)
+    app.run(debug=True)
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+def _bucket_starts(x, n_buckets):
+    # x(정렬된 시간축)를 동일 시간 폭 n_buckets개로 나눈 각 버킷의 시작 인덱스
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)[1:-1]
+    starts = np.concatenate(([0], np.searchsorted(x, edges, side="left")))
+    # 비어 있는 버킷 제거
+    return np.unique(starts)
+
+
+def minmax(x, y, n_buckets):
+    """픽셀 버킷마다 최솟값/최댓값 지점을 남기는 다운샘플링 (스파이크 보존)"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n <= 2 * n_buckets:
+        return x, y
+    starts = _bucket_starts(x, n_buckets)
+    counts = np.diff(np.append(starts, n))
+    idx = np.arange(n)
+    # fmin/fmax는 NaN을 건너뜀 (버킷 전체가 NaN이면 결과도 NaN)
+    min_vals = np.repeat(np.fmin.reduceat(y, starts), counts)
+    max_vals = np.repeat(np.fmax.reduceat(y, starts), counts)
+    first_min = np.minimum.reduceat(np.where(y == min_vals, idx, n), starts)
+    first_max = np.minimum.reduceat(np.where(y == max_vals, idx, n), starts)
+    keep = np.unique(np.concatenate((first_min, first_max)))
+    # 전부 NaN인 버킷은 일치하는 인덱스가 없어 n이 됨
+    keep = keep[keep < n]
+    return x[keep], y[keep]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets 다운샘플링 (선 모양 보존)"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    # NaN이 있으면 면적/평균이 모두 NaN이 되므로 유효한 점만 사용
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+    # 첫/마지막 점은 고정, 나머지를 n_out - 2개 버킷으로 분할
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 끝점)
+        if i + 2 < len(bounds):
+            nlo, nhi = hi, bounds[i + 2]
+            cx = xf[nlo:nhi].mean()
+            cy = yf[nlo:nhi].mean()
+        else:
+            cx, cy = xf[-1], yf[-1]
+        ax, ay = xf[a], yf[a]
+        area = np.abs((ax - cx) * (yf[lo:hi] - ay) - (ax - xf[lo:hi]) * (cy - ay))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def downsample(x, y, n_points, method="lttb"):
+    # minmax는 버킷당 2점을 남기므로 버킷 수를 절반으로
+    if method == "minmax":
+        return minmax(x, y, max(n_points // 2, 1))
+    return METHODS[method](x, y, n_points)
@@ -0,0 +1,171 @@
+import os
+import threading
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from downsample import METHODS, downsample
+
+# 대시보드 그래프 폭(px) 기준 기본 포인트 수
+DEFAULT_POINTS = 1000
+MAX_POINTS = 5000
+# 늦게 커밋된 행(작은 id)을 놓치지 않도록 매 조회마다 다시 읽는 최근 id 구간
+ID_OVERLAP = 1000
+
+
+class TrendSeriesStore:
+    """키워드별 트렌드 시계열 저장소 + 서버 사이드 다운샘플링 조회 API
+
+    시계열은 (timestamp ms, volume) numpy 배열로 보관하고, 범위 조회 결과는
+    (keyword, 범위, 포인트 수, 방식, 데이터 버전) 단위로 캐시합니다.
+    """
+
+    def __init__(self, fetch_new=None, cache_size=256):
+        # fetch_new() -> {keyword: (ts_ms, values)}, sync()에서 호출
+        # 이전 호출에서 반환하지 않은 행만 반환해야 함 (조회 위치는 데이터 소스가 관리)
+        self.fetch_new = fetch_new
+        self._series = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._query_cached = lru_cache(maxsize=cache_size)(self._query)
+
+    def keywords(self):
+        return sorted(self._series)
+
+    def append(self, keyword, ts, values):
+        ts = np.asarray(ts, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        if len(ts) == 0:
+            return
+        with self._lock:
+            old_ts, old_values = self._series.get(
+                keyword, (np.empty(0, np.int64), np.empty(0, np.float64))
+            )
+            ts = np.concatenate((old_ts, ts))
+            values = np.concatenate((old_values, values))
+            # 늦게 커밋된 행은 마지막 시각보다 이전일 수 있으므로 시각순으로 병합
+            if np.any(np.diff(ts[max(len(old_ts) - 1, 0) :]) < 0):
+                order = np.argsort(ts, kind="stable")
+                ts, values = ts[order], values[order]
+            self._series[keyword] = (ts, values)
+            # 버전이 바뀌면 이전 캐시 키는 더 이상 조회되지 않음
+            self._versions[keyword] = self._versions.get(keyword, 0) + 1
+
+    def sync(self):
+        if self.fetch_new is None:
+            return
+        # 여러 콜백이 동시에 호출해도 조회는 한 번만 수행
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            for keyword, (ts, values) in self.fetch_new().items():
+                self.append(keyword, ts, values)
+        finally:
+            self._sync_lock.release()
+
+    def query(
+        self, keyword, start=None, end=None, n_points=DEFAULT_POINTS, method="lttb"
+    ):
+        """[start, end] 구간(ms)을 최대 n_points개로 다운샘플링하여 반환"""
+        if keyword not in self._series:
+            raise KeyError(keyword)
+        if method not in METHODS:
+            raise ValueError(f"지원하지 않는 다운샘플링 방식: {method}")
+        n_points = int(min(max(n_points, 3), MAX_POINTS))
+        return self._query_cached(
+            keyword, start, end, n_points, method, self._versions[keyword]
+        )
+
+    def _query(self, keyword, start, end, n_points, method, version):
+        ts, values = self._series[keyword]
+        lo = 0 if start is None else np.searchsorted(ts, start, side="left")
+        hi = len(ts) if end is None else np.searchsorted(ts, end, side="right")
+        x, y = downsample(ts[lo:hi], values[lo:hi], n_points, method)
+        # 캐시된 결과를 호출자가 수정하지 못하도록 읽기 전용
+        x.flags.writeable = False
+        y.flags.writeable = False
+        return x, y
+
+    def since(self, keyword, after, n_points=DEFAULT_POINTS, method="lttb"):
+        """after(ms) 이후 새로 들어온 포인트만 반환 (증분 업데이트용)"""
+        ts, values = self._series[keyword]
+        lo = np.searchsorted(ts, after, side="right")
+        return downsample(ts[lo:], values[lo:], n_points, method)
+
+
+def demo_fetch_new(keywords=("인스타그램 릴스", "틱톡 마케팅", "AI 마케팅", "메타버스 광고"), seed=42):
+    """DB 없이 실행할 때 사용하는 예시 데이터 소스 (1초 간격 랜덤 워크)"""
+    rng = np.random.default_rng(seed)
+    levels = {k: float(rng.integers(1000, 5000)) for k in keywords}
+
+    state = {"last": None}
+
+    def fetch_new():
+        now = int(time.time() * 1000)
+        # 최초 호출 시 최근 24시간 분량 생성
+        last = state["last"]
+        first = now - 24 * 3600 * 1000 if last is None else last + 1000
+        ts = np.arange(first, now + 1, 1000, dtype=np.int64)
+        if len(ts):
+            state["last"] = int(ts[-1])
+        out = {}
+        for k in keywords:
+            walk = levels[k] + np.cumsum(rng.normal(0, 5, len(ts)))
+            if len(ts):
+                levels[k] = float(walk[-1])
+            out[k] = (ts, walk)
+        return out
+
+    return fetch_new
+
+
+def db_fetch_new(database_url, id_overlap=ID_OVERLAP):
+    """trends 테이블(id, keyword, volume, created_at)에서 새 행을 읽는 데이터 소스
+
+    created_at(트랜잭션 시작 시각)이나 id는 커밋 순서와 다를 수 있으므로,
+    마지막 id 이전 id_overlap 구간을 다시 읽고 이미 반환한 id는 제외합니다.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(database_url)
+    query = text(
+        "SELECT id, keyword, volume, created_at FROM trends "
+        "WHERE id > :low ORDER BY id"
+    )
+    state = {"max_id": 0, "seen": set()}
+
+    def fetch_new():
+        low = max(state["max_id"] - id_overlap, 0)
+        df = pd.read_sql(query, engine, params={"low": low})
+        df = df[~df["id"].isin(state["seen"])]
+        if len(df):
+            state["max_id"] = max(state["max_id"], int(df["id"].max()))
+        # 다음 조회 구간에 포함될 id만 기억
+        low = state["max_id"] - id_overlap
+        state["seen"] = {i for i in state["seen"] if i > low} | {
+            int(i) for i in df["id"] if i > low
+        }
+        # volume이 NULL인 행은 값이 없는 것으로 보고 제외
+        df = df.dropna(subset=["volume"])
+        # created_at은 TIMESTAMP(타임존 없음), UTC로 취급하여 epoch ms로 변환
+        created_at = pd.to_datetime(df["created_at"])
+        df = df.assign(
+            ts=(created_at - pd.Timestamp(0)) // pd.Timedelta(milliseconds=1)
+        ).sort_values("ts", kind="stable")
+        return {
+            k: (g["ts"].to_numpy(), g["volume"].to_numpy(dtype=np.float64))
+            for k, g in df.groupby("keyword")
+        }
+
+    return fetch_new
+
+
+def create_store():
+    database_url = os.getenv("DATABASE_URL")
+    fetch_new = db_fetch_new(database_url) if database_url else demo_fetch_new()
+    store = TrendSeriesStore(fetch_new)
+    store.sync()
+    return store
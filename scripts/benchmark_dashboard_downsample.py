@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# 대시보드 시계열 다운샘플링 벤치마크 (payload 크기 / 조회·figure 생성·콜백 지연)
+#
+# 사용법:
+#   python scripts/benchmark_dashboard_downsample.py --points 1000000
+#
+# 브라우저 렌더링 시간은 측정할 수 없으므로, 서버에서 figure JSON을 만드는 시간과
+# 브라우저로 전송되는 payload 크기를 렌더링 비용의 지표로 사용합니다.
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "apps", "ai-engine"))
+
+from trend_series import DEFAULT_POINTS, TrendSeriesStore  # noqa: E402
+
+KEYWORD = "AI 마케팅"
+
+
+def timed(fn, repeat=5):
+    # 최솟값(ms)과 마지막 결과 반환
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def figure_json(x, y):
+    fig = go.Figure(go.Scattergl(x=x.tolist(), y=y.tolist(), mode="lines"))
+    fig.update_layout(xaxis={"type": "date"})
+    return pio.to_json(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    ts = 1_700_000_000_000 + np.arange(args.points, dtype=np.int64) * 1000
+    values = 3000 + np.cumsum(rng.normal(0, 5, args.points))
+    store = TrendSeriesStore()
+    store.append(KEYWORD, ts, values)
+
+    print(f"[벤치마크] 시계열 {args.points:,} points, 목표 {DEFAULT_POINTS} points")
+    print("case\tpoints\tpayload_kb\tquery_ms\tfigure_json_ms")
+
+    ms, payload = timed(lambda: figure_json(ts, values), repeat=1)
+    print(f"raw\t{args.points}\t{len(payload) / 1024:.0f}\t-\t{ms:.1f}")
+
+    for method in ("lttb", "minmax"):
+        # 캐시 미적중: 조회마다 새 구간
+        cold_ms, (x, y) = timed(
+            lambda: store.query(
+                KEYWORD, int(ts[0]) + rng.integers(1000), None, DEFAULT_POINTS, method
+            )
+        )
+        warm_ms, (x, y) = timed(
+            lambda: store.query(KEYWORD, None, None, DEFAULT_POINTS, method)
+        )
+        json_ms, payload = timed(lambda: figure_json(x, y))
+        print(
+            f"{method}\t{len(x)}\t{len(payload) / 1024:.1f}\t"
+            f"{cold_ms:.1f} (cached {warm_ms:.3f})\t{json_ms:.1f}"
+        )
+
+    # 증분 콜백: 5초 분량 새 포인트만 전송 vs figure 전체 재생성
+    last = int(ts[-1])
+    new_ts = last + np.arange(1, 6, dtype=np.int64) * 1000
+    store.append(KEYWORD, new_ts, values[-5:])
+    inc_ms, (x, y) = timed(lambda: store.since(KEYWORD, last))
+    inc_payload = len(pio.json.to_json_plotly({"x": [x.tolist()], "y": [y.tolist()]}))
+    # 데이터 버전이 바뀌었으므로 캐시 미적중 상태의 조회 + figure 생성
+    full_ms, full_json = timed(
+        lambda: figure_json(*store.query(KEYWORD, None, None, DEFAULT_POINTS, "lttb")),
+        repeat=1,
+    )
+    full_payload = len(full_json)
+    print("\ncallback\tpayload_bytes\tlatency_ms")
+    print(f"incremental\t{inc_payload}\t{inc_ms:.3f}")
+    print(f"full_refresh\t{full_payload}\t{full_ms:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# 인메모리 fit vs 청크 스트리밍 partial_fit 학습 벤치마크 (피크 메모리/소요 시간)
+#
+# 사용법:
+#   python scripts/benchmark_streaming_train.py --rows 10000000
+#
+# 각 케이스는 별도 프로세스에서 실행하여 피크 RSS(ru_maxrss)를 독립적으로 측정합니다.
+# 입력은 .npy 파일만 측정합니다 (DB/Parquet 스트리밍은 측정 대상 아님).
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+N_FEATURES = 8
+WRITE_CHUNK = 1_000_000
+
+
+def generate(data_dir, rows, seed=42):
+    # 합성 데이터를 청크 단위로 .npy에 기록 (생성 과정도 메모리에 전체를 올리지 않음)
+    paths = {
+        name: os.path.join(data_dir, f"{name}.npy") for name in ("X", "y_cls", "y_reg")
+    }
+    if all(os.path.exists(p) for p in paths.values()):
+        if len(np.load(paths["X"], mmap_mode="r")) == rows:
+            return paths
+    os.makedirs(data_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    weights = rng.normal(size=N_FEATURES).astype(np.float32)
+    X = np.lib.format.open_memmap(
+        paths["X"], mode="w+", dtype=np.float32, shape=(rows, N_FEATURES)
+    )
+    y_cls = np.lib.format.open_memmap(
+        paths["y_cls"], mode="w+", dtype=np.int8, shape=(rows,)
+    )
+    y_reg = np.lib.format.open_memmap(
+        paths["y_reg"], mode="w+", dtype=np.float32, shape=(rows,)
+    )
+    for start in range(0, rows, WRITE_CHUNK):
+        stop = min(start + WRITE_CHUNK, rows)
+        x = rng.normal(size=(stop - start, N_FEATURES)).astype(np.float32)
+        score = x @ weights + rng.normal(scale=0.5, size=stop - start)
+        X[start:stop] = x
+        y_cls[start:stop] = score > 0
+        y_reg[start:stop] = score
+    X.flush()
+    y_cls.flush()
+    y_reg.flush()
+    return paths
+
+
+def run_case(task, mode, data_dir, chunk_size):
+    from src.models.classification import ClassificationModel
+    from src.models.regression import RegressionModel
+    from src.models.streaming import iter_npy_chunks
+
+    x_path = os.path.join(data_dir, "X.npy")
+    y_path = os.path.join(data_dir, "y_cls.npy" if task == "cls" else "y_reg.npy")
+    model_cls = ClassificationModel if task == "cls" else RegressionModel
+    model = model_cls(incremental=(mode == "stream"))
+
+    start = time.perf_counter()
+    if mode == "stream":
+        chunks = iter_npy_chunks(x_path, y_path, chunk_size=chunk_size)
+        if task == "cls":
+            model.train_stream(chunks, classes=np.array([0, 1]))
+        else:
+            model.train_stream(chunks)
+    else:
+        model.train(np.load(x_path), np.load(y_path))
+    elapsed = time.perf_counter() - start
+
+    # 평가는 앞쪽 10만 행으로만 수행 (학습 비용 비교가 목적)
+    X_eval = np.load(x_path, mmap_mode="r")[:100_000]
+    y_eval = np.load(y_path, mmap_mode="r")[:100_000]
+    score = model.evaluate(X_eval, y_eval)
+    # Linux ru_maxrss 단위는 KB
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{task}\t{mode}\t{elapsed:.2f}\t{peak_mb:.1f}\t{score:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--data-dir", default="/tmp/mrmark_stream_bench")
+    parser.add_argument("--modes", default="inmemory,stream")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        task, mode = args.case.split(":")
+        run_case(task, mode, args.data_dir, args.chunk_size)
+        return
+
+    print(f"[벤치마크] 합성 데이터 생성: {args.rows:,} rows x {N_FEATURES} features")
+    generate(args.data_dir, args.rows)
+    print("task\tmode\tseconds\tpeak_rss_mb\tscore")
+    for task in ("cls", "reg"):
+        for mode in args.modes.split(","):
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--rows",
+                    str(args.rows),
+                    "--chunk-size",
+                    str(args.chunk_size),
+                    "--data-dir",
+                    args.data_dir,
+                    "--case",
+                    f"{task}:{mode}",
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
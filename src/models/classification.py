@@ -1,15 +1,30 @@
 from .base_model import BaseModel
-from sklearn.linear_model import LogisticRegression
+from .streaming import partial_fit_chunks
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.metrics import accuracy_score
 
 
 class ClassificationModel(BaseModel):
-    def __init__(self):
-        self.model = LogisticRegression()
+    def __init__(self, incremental=False):
+        # incremental=True: 메모리에 다 올릴 수 없는 데이터용 SGD(partial_fit) 모델
+        self.incremental = incremental
+        if incremental:
+            self.model = SGDClassifier(loss="log_loss")
+        else:
+            self.model = LogisticRegression()
 
     def train(self, X, y):
         self.model.fit(X, y)
 
+    def train_stream(self, chunks, classes, prefetch_size=2):
+        # chunks: (X, y) 청크 iterable (streaming.iter_*_chunks 참고)
+        # classes: 전체 라벨 목록 (첫 청크에 모든 클래스가 없을 수 있으므로 필수)
+        if not self.incremental:
+            raise ValueError("train_stream은 incremental=True 모델에서만 사용 가능합니다.")
+        return partial_fit_chunks(
+            self.model, chunks, prefetch_size=prefetch_size, classes=classes
+        )
+
     def predict(self, X):
         return self.model.predict(X)
 
@@ -1,15 +1,27 @@
 from .base_model import BaseModel
-from sklearn.linear_model import LinearRegression
+from .streaming import partial_fit_chunks
+from sklearn.linear_model import LinearRegression, SGDRegressor
 from sklearn.metrics import mean_squared_error
 
 
 class RegressionModel(BaseModel):
-    def __init__(self):
-        self.model = LinearRegression()
+    def __init__(self, incremental=False):
+        # incremental=True: 메모리에 다 올릴 수 없는 데이터용 SGD(partial_fit) 모델
+        self.incremental = incremental
+        if incremental:
+            self.model = SGDRegressor()
+        else:
+            self.model = LinearRegression()
 
     def train(self, X, y):
         self.model.fit(X, y)
 
+    def train_stream(self, chunks, prefetch_size=2):
+        # chunks: (X, y) 청크 iterable (streaming.iter_*_chunks 참고)
+        if not self.incremental:
+            raise ValueError("train_stream은 incremental=True 모델에서만 사용 가능합니다.")
+        return partial_fit_chunks(self.model, chunks, prefetch_size=prefetch_size)
+
     def predict(self, X):
         return self.model.predict(X)
 
@@ -0,0 +1,142 @@
+import queue
+import threading
+
+import numpy as np
+
+# 청크 한 개당 행 수 (float32 8컬럼 기준 약 3MB)
+DEFAULT_CHUNK_SIZE = 100_000
+
+_END = object()
+
+
+def iter_array_chunks(X, y, chunk_size=DEFAULT_CHUNK_SIZE):
+    # X, y: np.ndarray 또는 np.memmap, 앞에서부터 chunk_size 행씩 잘라서 반환
+    for start in range(0, len(X), chunk_size):
+        stop = start + chunk_size
+        yield np.asarray(X[start:stop]), np.asarray(y[start:stop])
+
+
+def _read_npy_header(f):
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    if fortran_order:
+        raise ValueError("Fortran order .npy 파일은 청크 단위로 읽을 수 없습니다.")
+    return shape, dtype
+
+
+def iter_npy_chunks(x_path, y_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # .npy 파일을 순차적으로 읽음 (memmap과 달리 읽은 페이지가 RSS에 누적되지 않음)
+    with open(x_path, "rb") as fx, open(y_path, "rb") as fy:
+        x_shape, x_dtype = _read_npy_header(fx)
+        y_shape, y_dtype = _read_npy_header(fy)
+        if x_shape[0] != y_shape[0]:
+            raise ValueError(f"X/y 행 수가 다릅니다: {x_shape[0]} != {y_shape[0]}")
+        row_shape = x_shape[1:]
+        row_size = int(np.prod(row_shape))
+        for start in range(0, x_shape[0], chunk_size):
+            n = min(chunk_size, x_shape[0] - start)
+            X = np.fromfile(fx, dtype=x_dtype, count=n * row_size)
+            y = np.fromfile(fy, dtype=y_dtype, count=n)
+            yield X.reshape((n,) + row_shape), y
+
+
+def iter_parquet_chunks(
+    path, feature_columns, target_column, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    # pyarrow는 Parquet 입력에서만 필요하므로 지연 import
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    columns = list(feature_columns) + [target_column]
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        # SGD partial_fit은 NaN을 받지 않으므로 null이 있는 행은 제외
+        batch = pc.drop_null(batch)
+        if batch.num_rows == 0:
+            continue
+        # bool 컬럼은 zero-copy 변환이 불가능
+        X = np.column_stack(
+            [
+                batch.column(name).to_numpy(zero_copy_only=False)
+                for name in feature_columns
+            ]
+        )
+        y = batch.column(target_column).to_numpy(zero_copy_only=False)
+        yield X, y
+
+
+def iter_sql_chunks(
+    query, engine, feature_columns, target_column, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    # engine: SQLAlchemy engine (예: sns_data 테이블 조회)
+    # pd.read_sql(chunksize=)는 기본 커서가 결과 전체를 먼저 메모리에 올리므로
+    # 서버 사이드 커서(stream_results)로 chunk_size 행씩 가져옴
+    import pandas as pd
+    from sqlalchemy import text
+
+    if isinstance(query, str):
+        query = text(query)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(query)
+        columns = list(result.keys())
+        for rows in result.yield_per(chunk_size).partitions():
+            df = pd.DataFrame(rows, columns=columns)
+            # SGD partial_fit은 NaN을 받지 않으므로 NULL이 있는 행은 제외
+            df = df.dropna(subset=list(feature_columns) + [target_column])
+            if df.empty:
+                continue
+            yield df[list(feature_columns)].to_numpy(), df[target_column].to_numpy()
+
+
+def prefetch(chunks, buffer_size=2):
+    """백그라운드 스레드에서 다음 청크를 미리 읽어 I/O와 학습을 겹쳐 실행"""
+    buffer = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def _put(item):
+        # 소비자가 중단한 경우 대기하지 않고 종료
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader():
+        try:
+            for chunk in chunks:
+                if not _put(chunk):
+                    return
+        except BaseException as e:
+            _put(e)
+            return
+        _put(_END)
+
+    thread = threading.Thread(target=_reader, name="chunk-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def partial_fit_chunks(estimator, chunks, prefetch_size=2, **fit_params):
+    """청크 단위로 estimator.partial_fit 호출, 학습한 총 행 수 반환"""
+    if prefetch_size:
+        chunks = prefetch(chunks, buffer_size=prefetch_size)
+    n_rows = 0
+    for X, y in chunks:
+        estimator.partial_fit(X, y, **fit_params)
+        n_rows += len(X)
+    return n_rows
@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps", "ai-engine")
+)
+
+from downsample import lttb, minmax  # noqa: E402
+from trend_series import TrendSeriesStore  # noqa: E402
+
+
+def test_lttb_keeps_endpoints_and_size():
+    x = np.arange(10_000)
+    y = np.sin(x / 100.0)
+    dx, dy = lttb(x, y, 500)
+    assert len(dx) == 500
+    assert dx[0] == 0 and dx[-1] == 9_999
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_minmax_preserves_spike():
+    x = np.arange(10_000)
+    y = np.zeros(10_000)
+    y[4321] = 100.0
+    dx, dy = minmax(x, y, 100)
+    assert len(dx) <= 200
+    assert dy.max() == 100.0 and 4321 in dx
+
+
+def test_minmax_skips_nan():
+    x = np.arange(10_000)
+    y = np.sin(x / 100.0)
+    y[50:150] = np.nan
+    y[200:300] = np.nan
+    y[-1] = np.nan
+    dx, dy = minmax(x, y, 100)
+    assert len(dx) <= 200
+    assert not np.isnan(dy).any()
+
+
+def test_lttb_skips_nan():
+    x = np.arange(10_000)
+    y = np.sin(x / 100.0)
+    y[50:150] = np.nan
+    y[-1] = np.nan
+    dx, dy = lttb(x, y, 500)
+    assert len(dx) == 500
+    assert not np.isnan(dy).any()
+    # NaN이 없었다면 선택됐을 극값 부근이 유지됨
+    assert dy.max() > 0.99 and dy.min() < -0.99
+
+
+def test_store_query_cache_and_since():
+    store = TrendSeriesStore()
+    store.append("AI 마케팅", np.arange(0, 10_000, 10), np.random.rand(1000))
+    first = store.query("AI 마케팅", n_points=100)
+    assert store.query("AI 마케팅", n_points=100) is first
+    store.append("AI 마케팅", [10_000, 10_010], [1.0, 2.0])
+    assert store.query("AI 마케팅", n_points=100) is not first
+    x, y = store.since("AI 마케팅", 9_990)
+    assert x.tolist() == [10_000, 10_010] and y.tolist() == [1.0, 2.0]
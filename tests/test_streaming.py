@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from src.models.classification import ClassificationModel
+from src.models.regression import RegressionModel
+from src.models.streaming import (
+    iter_array_chunks,
+    iter_npy_chunks,
+    iter_parquet_chunks,
+    iter_sql_chunks,
+    prefetch,
+)
+
+
+def test_iter_npy_chunks(tmp_path):
+    X = np.arange(20, dtype=np.float32).reshape(10, 2)
+    y = np.arange(10)
+    np.save(tmp_path / "X.npy", X)
+    np.save(tmp_path / "y.npy", y)
+    chunks = list(iter_npy_chunks(tmp_path / "X.npy", tmp_path / "y.npy", 4))
+    assert [len(c[0]) for c in chunks] == [4, 4, 2]
+    assert np.array_equal(np.concatenate([c[1] for c in chunks]), y)
+
+
+def test_iter_parquet_chunks_bool_target_and_nulls(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    n = 200
+    likes = list(range(n))
+    likes[1] = None
+    viral = [i % 3 != 0 for i in range(n)]
+    viral[5] = None
+    table = pa.table(
+        {
+            "likes": pa.array(likes, type=pa.int64()),
+            "shares": pa.array([i * 0.5 for i in range(n)]),
+            "viral": pa.array(viral, type=pa.bool_()),
+        }
+    )
+    pq.write_table(table, tmp_path / "sns.parquet")
+    chunks = iter_parquet_chunks(
+        tmp_path / "sns.parquet", ["likes", "shares"], "viral", chunk_size=16
+    )
+    model = ClassificationModel(incremental=True)
+    # null이 있는 2개 행은 제외하고 학습
+    assert model.train_stream(chunks, classes=[False, True]) == n - 2
+
+
+def test_iter_sql_chunks(tmp_path):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'sns.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.text(
+                "CREATE TABLE sns_data (likes INTEGER, shares INTEGER, label INTEGER)"
+            )
+        )
+        conn.execute(
+            sqlalchemy.text("INSERT INTO sns_data VALUES (:likes, :shares, :label)"),
+            [{"likes": i, "shares": 2 * i, "label": i % 2} for i in range(10)]
+            + [{"likes": None, "shares": 1, "label": 0}],
+        )
+    chunks = list(
+        iter_sql_chunks(
+            "SELECT likes, shares, label FROM sns_data",
+            engine,
+            ["likes", "shares"],
+            "label",
+            chunk_size=4,
+        )
+    )
+    assert [len(c[0]) for c in chunks] == [4, 4, 2]
+    assert chunks[0][0].shape == (4, 2)
+    # NULL 행은 제외되고 NaN이 남지 않음
+    assert not np.isnan(np.concatenate([c[0] for c in chunks])).any()
+    assert np.concatenate([c[1] for c in chunks]).tolist() == [0, 1] * 5
+
+
+def test_prefetch_propagates_errors():
+    def chunks():
+        yield 1
+        raise RuntimeError("read failed")
+
+    it = prefetch(chunks())
+    assert next(it) == 1
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_train_stream():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, 3))
+    y_reg = X @ np.array([1.0, -2.0, 0.5])
+    y_cls = (y_reg > 0).astype(int)
+
+    cls_model = ClassificationModel(incremental=True)
+    assert cls_model.train_stream(iter_array_chunks(X, y_cls, 256), [0, 1]) == 2000
+    assert cls_model.evaluate(X, y_cls) > 0.9
+
+    reg_model = RegressionModel(incremental=True)
+    reg_model.train_stream(iter_array_chunks(X, y_reg, 256))
+    assert reg_model.evaluate(X, y_reg) < 0.1
+
+    with pytest.raises(ValueError):
+        RegressionModel().train_stream(iter_array_chunks(X, y_reg, 256))
@@ -0,0 +1,161 @@
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps", "ai-engine")
+)
+
+from trend_series import TrendSeriesStore, db_fetch_new  # noqa: E402
+
+
+def _trends_db(tmp_path, rows):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    url = f"sqlite:///{tmp_path / 'trends.db'}"
+    engine = sqlalchemy.create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.text(
+                "CREATE TABLE IF NOT EXISTS trends (id INTEGER PRIMARY KEY, "
+                "keyword TEXT, volume INTEGER, created_at TIMESTAMP)"
+            )
+        )
+        conn.execute(
+            sqlalchemy.text(
+                "INSERT INTO trends VALUES (:id, :keyword, :volume, :created_at)"
+            ),
+            rows,
+        )
+    return url
+
+
+def _row(id, volume, created_at):
+    return {"id": id, "keyword": "AI 마케팅", "volume": volume, "created_at": created_at}
+
+
+def test_db_fetch_new_watermark(tmp_path):
+    url = _trends_db(
+        tmp_path,
+        [
+            _row(1, 10, "2026-10-19 00:00:00"),
+            _row(2, None, "2026-10-19 00:00:01"),
+            _row(4, 40, "2026-10-19 00:00:03"),
+            # 같은 밀리초의 행도 모두 반영
+            _row(5, 50, "2026-10-19 00:00:03"),
+        ],
+    )
+    t0 = 1792368000000
+    fetch_new = db_fetch_new(url)
+    store = TrendSeriesStore(fetch_new)
+    store.sync()
+    x, y = store.query("AI 마케팅")
+    assert x.tolist() == [t0, t0 + 3000, t0 + 3000]
+    assert y.tolist() == [10.0, 40.0, 50.0]
+    # 같은 위치에서 다시 조회해도 중복 없음
+    assert fetch_new() == {}
+
+    # 늦게 커밋된 행: 더 작은 id, 더 이른 created_at
+    _trends_db(tmp_path, [_row(3, 30, "2026-10-19 00:00:02")])
+    store.sync()
+    x, y = store.query("AI 마케팅")
+    assert x.tolist() == [t0, t0 + 2000, t0 + 3000, t0 + 3000]
+    assert y.tolist() == [10.0, 30.0, 40.0, 50.0]
+    assert fetch_new() == {}
+
+
+def _store(n=2000):
+    store = TrendSeriesStore()
+    store.append("AI 마케팅", np.arange(n) * 1000, np.sin(np.arange(n) / 50.0))
+    return store
+
+
+def test_trend_series_endpoint(monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    import app
+
+    store = _store()
+    monkeypatch.setattr(app, "_trend_store", store)
+    client = TestClient(app.app)
+
+    r = client.get("/trends/series", params={"keyword": "없는 키워드"})
+    assert r.status_code == 404
+
+    r = client.get("/trends/series", params={"keyword": "AI 마케팅", "points": 100})
+    assert r.status_code == 200 and len(r.json()["x"]) == 100
+
+    store.append("AI 마케팅", [2_000_000, 2_001_000], [1.0, 2.0])
+    r = client.get("/trends/series", params={"keyword": "AI 마케팅", "after": 1_999_000})
+    assert r.json()["x"] == [2_000_000, 2_001_000]
+    assert r.json()["y"] == [1.0, 2.0]
+
+    r = client.get(
+        "/trends/series",
+        params={"keyword": "AI 마케팅", "start": 500_000, "end": 100_000},
+    )
+    assert r.status_code == 200
+    assert r.json()["x"] == [] and r.json()["y"] == []
+
+
+def test_get_trend_store_creates_once(monkeypatch):
+    pytest.importorskip("fastapi")
+    import app
+    import trend_series
+
+    calls = []
+
+    def slow_create_store():
+        calls.append(1)
+        time.sleep(0.1)
+        return TrendSeriesStore()
+
+    monkeypatch.setattr(app, "_trend_store", None)
+    monkeypatch.setattr(trend_series, "create_store", slow_create_store)
+    threads = [threading.Thread(target=app.get_trend_store) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+
+
+def test_dashboard_graph_update(monkeypatch):
+    dash = pytest.importorskip("dash")
+    import dashboard
+
+    # 키워드가 없으면(빈 trends 테이블) 빈 figure
+    fig, _, state = dashboard.graph_update("keyword", None, "lttb", None, None)
+    assert len(fig.data) == 0
+    assert state == {"last_ts": None, "live": True, "appended": 0}
+
+    store = _store()
+    monkeypatch.setattr(dashboard, "store", store)
+    fig, _, state = dashboard.graph_update("keyword", "AI 마케팅", "lttb", None, None)
+    assert len(fig.data[0].x) == dashboard.DEFAULT_POINTS
+    assert state == {"last_ts": 1_999_000, "live": True, "appended": 0}
+
+    # 새 포인트만 extendData로 전송 (maxPoints 없음)
+    store.append("AI 마케팅", [2_000_000, 2_001_000], [1.0, 2.0])
+    fig, extend, state = dashboard.graph_update(
+        "live-interval", "AI 마케팅", "lttb", None, state
+    )
+    assert fig is dash.no_update
+    assert extend == ({"x": [[2_000_000, 2_001_000]], "y": [[1.0, 2.0]]}, [0])
+    assert state["last_ts"] == 2_001_000 and state["appended"] == 2
+
+    # 이어 붙인 포인트가 LIVE_REFRESH_POINTS를 넘으면 전체 구간 재렌더링
+    n = dashboard.LIVE_REFRESH_POINTS
+    new_ts = 2_002_000 + np.arange(n) * 1000
+    store.append("AI 마케팅", new_ts, np.zeros(n))
+    fig, extend, state = dashboard.graph_update(
+        "live-interval", "AI 마케팅", "lttb", None, state
+    )
+    assert extend is dash.no_update
+    assert fig.data[0].x[0] == 0 and fig.data[0].x[-1] == new_ts[-1]
+    assert state == {"last_ts": int(new_ts[-1]), "live": True, "appended": 0}